@@ -10,6 +10,7 @@ from .exceptions import DuplicateChildError
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator
+    from re import Pattern
 
     from .child import HConfigChild
     from .models import MatchRule, SetLikeOfStr
@@ -137,7 +138,7 @@ class HConfigBase(ABC):  # noqa: PLR0904
             startswith=rule.startswith,
             endswith=rule.endswith,
             contains=rule.contains,
-            re_search=rule.re_search,
+            re_search=rule.re_search_pattern,
         ):
             if remaining_rules:
                 yield from child.get_children_deep(remaining_rules)
@@ -151,7 +152,7 @@ class HConfigBase(ABC):  # noqa: PLR0904
         startswith: Union[str, tuple[str, ...], None] = None,
         endswith: Union[str, tuple[str, ...], None] = None,
         contains: Union[str, tuple[str, ...], None] = None,
-        re_search: Optional[str] = None,
+        re_search: Union[str, Pattern[str], None] = None,
     ) -> Optional[HConfigChild]:
         """Find a child by text_match rule. If it is not found, return None."""
         return next(
@@ -172,7 +173,7 @@ class HConfigBase(ABC):  # noqa: PLR0904
         startswith: Union[str, tuple[str, ...], None] = None,
         endswith: Union[str, tuple[str, ...], None] = None,
         contains: Union[str, tuple[str, ...], None] = None,
-        re_search: Optional[str] = None,
+        re_search: Union[str, Pattern[str], None] = None,
     ) -> Iterator[HConfigChild]:
         """Find all children matching a text_match rule and return them."""
         # For isinstance(equals, str) only matches, find the first child using children_dict
@@ -191,17 +192,8 @@ class HConfigBase(ABC):  # noqa: PLR0904
             isinstance(startswith, (str, tuple))
             and equals is endswith is contains is re_search is None
         ):
-            duplicates_allowed = None
-            for index, child in enumerate(self.children):
-                if child.text.startswith(startswith):
-                    yield child
-                    if duplicates_allowed is None:
-                        duplicates_allowed = self._is_duplicate_child_allowed()
-                    if duplicates_allowed:
-                        children_slice = slice(index + 1, None)
-                        break
-            else:
-                return
+            yield from self.children.starting_with(startswith)
+            return
 
         for child in self.children[children_slice]:
             if child.is_match(
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from itertools import chain
 from logging import getLogger
-from re import search
+from re import Pattern, search
 from typing import TYPE_CHECKING, Any, Optional, Union
 
 from .base import HConfigBase
@@ -118,11 +118,11 @@ class HConfigChild(  # noqa: PLR0904  pylint: disable=too-many-instance-attribut
 
     @property
     def sectional_exit(self) -> Optional[str]:
-        for rule in self.driver.rules.sectional_exiting:
-            if self.is_lineage_match(rule.match_rules):
-                if exit_text := rule.exit_text:
-                    return exit_text
-                return None
+        driver = self.driver
+        for rule in driver.matching_rules(driver.rules.sectional_exiting, self):
+            if exit_text := rule.exit_text:
+                return exit_text
+            return None
 
         if not self.children:
             return None
@@ -239,10 +239,8 @@ class HConfigChild(  # noqa: PLR0904  pylint: disable=too-many-instance-attribut
         return self.driver.swap_negation(self)
 
     def use_default_for_negation(self, config: HConfigChild) -> bool:
-        return any(
-            config.is_lineage_match(rule.match_rules)
-            for rule in self.driver.rules.negation_default_when
-        )
+        driver = self.driver
+        return any(driver.matching_rules(driver.rules.negation_default_when, config))
 
     @property
     def is_leaf(self) -> bool:
@@ -277,28 +275,26 @@ class HConfigChild(  # noqa: PLR0904  pylint: disable=too-many-instance-attribut
     def is_idempotent_command(self, other_children: Iterable[HConfigChild]) -> bool:
         """Determine if self.text is an idempotent change."""
         # Avoid list commands from matching as idempotent
-        for rule in self.driver.rules.idempotent_commands_avoid:
-            if self.is_lineage_match(rule.match_rules):
-                return False
+        driver = self.driver
+        if any(driver.matching_rules(driver.rules.idempotent_commands_avoid, self)):
+            return False
 
         # Idempotent command identification
-        return bool(self.driver.idempotent_for(self, other_children))
+        return bool(driver.idempotent_for(self, other_children))
 
     def use_sectional_overwrite_without_negation(self) -> bool:
         """Check self's text to see if negation should be handled by
         overwriting the section without first negating it.
         """
+        driver = self.driver
         return any(
-            self.is_lineage_match(rule.match_rules)
-            for rule in self.driver.rules.sectional_overwrite_no_negate
+            driver.matching_rules(driver.rules.sectional_overwrite_no_negate, self)
         )
 
     def use_sectional_overwrite(self) -> bool:
         """Determines if self.text matches a sectional overwrite rule."""
-        return any(
-            self.is_lineage_match(rule.match_rules)
-            for rule in self.driver.rules.sectional_overwrite
-        )
+        driver = self.driver
+        return any(driver.matching_rules(driver.rules.sectional_overwrite, self))
 
     def overwrite_with(
         self,
@@ -370,28 +366,36 @@ class HConfigChild(  # noqa: PLR0904  pylint: disable=too-many-instance-attribut
 
     def is_lineage_match(self, rules: tuple[MatchRule, ...]) -> bool:
         """A generic test against a lineage of HConfigChild objects."""
-        lineage = tuple(self.lineage())
-
-        return len(rules) == len(lineage) and all(
-            child.is_match(
-                equals=rule.equals,
-                startswith=rule.startswith,
-                endswith=rule.endswith,
-                contains=rule.contains,
-                re_search=rule.re_search,
-            )
+        # Test self against the last rule before walking the lineage,
+        # most rules are rejected by that test alone.
+        if len(rules) != self.depth() or not self._is_rule_match(rules[-1]):
+            return False
+
+        return all(
+            child._is_rule_match(rule)  # noqa: SLF001
             # add strict=True after 3.9 is deprecated
-            for (child, rule) in zip(reversed(lineage), reversed(rules))
+            for (child, rule) in zip(
+                reversed(tuple(self.parent.lineage())), reversed(rules[:-1])
+            )
+        )
+
+    def _is_rule_match(self, rule: MatchRule) -> bool:
+        return self.is_match(
+            equals=rule.equals,
+            startswith=rule.startswith,
+            endswith=rule.endswith,
+            contains=rule.contains,
+            re_search=rule.re_search_pattern,
         )
 
-    def is_match(  # noqa: PLR0911
+    def is_match(  # noqa: C901, PLR0911
         self,
         *,
         equals: Union[str, SetLikeOfStr, None] = None,
         startswith: Union[str, tuple[str, ...], None] = None,
         endswith: Union[str, tuple[str, ...], None] = None,
         contains: Union[str, tuple[str, ...], None] = None,
-        re_search: Optional[str] = None,
+        re_search: Union[str, Pattern[str], None] = None,
     ) -> bool:
         """True if `self.text` matches all the criteria.
 
@@ -413,10 +417,6 @@ class HConfigChild(  # noqa: PLR0904  pylint: disable=too-many-instance-attribut
         ):
             return False
 
-        # Regex filter
-        if isinstance(re_search, str) and not search(re_search, self.text):
-            return False
-
         # The below filters are less commonly used
         # Endswith filter
         if isinstance(endswith, (str, tuple)) and not self.text.endswith(endswith):
@@ -432,6 +432,16 @@ class HConfigChild(  # noqa: PLR0904  pylint: disable=too-many-instance-attribut
         ) and not any(c in self.text for c in contains):
             return False
 
+        # Regex filter, the most expensive so it runs last
+        if isinstance(re_search, str):
+            if not search(re_search, self.text):
+                return False
+        elif isinstance(  # pylint: disable=confusing-consecutive-elif
+            re_search,
+            Pattern,
+        ) and not re_search.search(self.text):
+            return False
+
         return True
 
     def add_children_deep(self, lines: Iterable[str]) -> HConfigChild:
@@ -451,7 +461,7 @@ class HConfigChild(  # noqa: PLR0904  pylint: disable=too-many-instance-attribut
 
     def _is_duplicate_child_allowed(self) -> bool:
         """Determine if duplicate(identical text) children are allowed under the parent."""
+        driver = self.driver
         return any(
-            self.is_lineage_match(rule.match_rules)
-            for rule in self.driver.rules.parent_allows_duplicate_child
+            driver.matching_rules(driver.rules.parent_allows_duplicate_child, self)
         )
@@ -8,12 +8,17 @@ if TYPE_CHECKING:
     from hier_config import HConfigChild
 
 _D = TypeVar("_D")
+# Below this many children, scanning them is cheaper than indexing them
+_FIRST_WORD_INDEX_MIN_CHILDREN = 16
 
 
 class HConfigChildren:
     def __init__(self) -> None:
         self._data: list[HConfigChild] = []
         self._mapping: dict[str, HConfigChild] = {}
+        # First word -> positions in self._data. Built on demand by
+        # starting_with() and dropped on every change.
+        self._first_words: Optional[dict[str, list[int]]] = None
 
     @overload
     def __getitem__(self, subscript: Union[int, str]) -> HConfigChild: ...
@@ -82,6 +87,7 @@ class HConfigChildren:
         update_mapping: bool = True,
     ) -> HConfigChild:
         self._data.append(child)
+        self._first_words = None
         if update_mapping:
             self._mapping.setdefault(child.text, child)
 
@@ -91,6 +97,48 @@ class HConfigChildren:
         """Delete all children."""
         self._data.clear()
         self._mapping.clear()
+        self._first_words = None
+
+    def starting_with(self, prefix: Union[str, tuple[str, ...]]) -> list[HConfigChild]:
+        """The children whose text starts with prefix, in order.
+
+        Only the children whose first word can match one of the prefixes are
+        checked, instead of every child. Short lists are simply scanned.
+        """
+        if len(self._data) < _FIRST_WORD_INDEX_MIN_CHILDREN:
+            return [child for child in self._data if child.text.startswith(prefix)]
+
+        if self._first_words is None:
+            self._first_words = {}
+            for position, child in enumerate(self._data):
+                self._first_words.setdefault(child.text.partition(" ")[0], []).append(
+                    position
+                )
+
+        prefixes = (prefix,) if isinstance(prefix, str) else prefix
+        buckets: list[list[int]] = []
+        for each_prefix in prefixes:
+            word, space, _ = each_prefix.partition(" ")
+            if space:
+                buckets.append(self._first_words.get(word, []))
+            else:
+                buckets.extend(
+                    word_positions
+                    for first_word, word_positions in self._first_words.items()
+                    if first_word.startswith(each_prefix)
+                )
+        # Merge several buckets back into the original order
+        positions = (
+            buckets[0]
+            if len(buckets) == 1
+            else sorted({p for bucket in buckets for p in bucket})
+        )
+
+        return [
+            child
+            for child in (self._data[position] for position in positions)
+            if child.text.startswith(prefix)
+        ]
 
     def delete(self, child_or_text: Union[HConfigChild, str]) -> None:
         """Delete a child from self._data and self._mapping."""
@@ -107,6 +155,7 @@ class HConfigChildren:
     def extend(self, children: Iterable[HConfigChild]) -> None:
         """Add child instances of HConfigChild."""
         self._data.extend(children)
+        self._first_words = None
         for child in children:
             self._mapping.setdefault(child.text, child)
 
@@ -121,5 +170,6 @@ class HConfigChildren:
     def rebuild_mapping(self) -> None:
         """Rebuild self._mapping."""
         self._mapping.clear()
+        self._first_words = None
         for child in self._data:
             self._mapping.setdefault(child.text, child)
@@ -1,14 +1,17 @@
+from collections.abc import Callable
 from contextlib import suppress
+from functools import lru_cache, partial
 from itertools import islice
 from logging import getLogger
 from pathlib import Path
-from re import search, sub
-from typing import Union
+from re import Pattern, error, search, sub
+from re import compile as re_compile
+from typing import Optional, Union
 
 from hier_config.platforms.driver_base import HConfigDriverBase
 
 from .child import HConfigChild
-from .models import Dump, Platform
+from .models import Dump, PerLineSubRule, Platform
 from .platforms.arista_eos.driver import HConfigDriverAristaEOS
 from .platforms.arista_eos.view import HConfigViewAristaEOS
 from .platforms.cisco_ios.driver import HConfigDriverCiscoIOS
@@ -214,8 +217,91 @@ def _config_from_string_lines_end_of_banner_test(
     return any(c in config_line for c in banner_end_contains)
 
 
-def _load_from_string_lines(config: HConfig, config_text: str) -> None:  # noqa: C901
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+_COMMENT_LINE = "^\\s*[#!].*"
+
+
+def _per_line_sub_function(rule: PerLineSubRule) -> Callable[[str], str]:
+    """Return a function applying rule to a line.
+
+    Rules that only match a literal at the start of a line e.g. '^version.*',
+    '^end$' or '^ no ip address', and the common comment rule, are applied
+    with str methods instead of running a regex substitution.
+    """
+    expression = rule.search
+    replace = rule.replace
+    if expression == _COMMENT_LINE and not replace:
+        return lambda line: "" if line.lstrip()[:1] in {"#", "!"} else line
+    if expression.startswith("^") and (
+        function := _start_of_line_literal_function(expression[1:], replace)
+    ):
+        return function
+
+    return partial(re_compile(expression).sub, replace)
+
+
+def _start_of_line_literal_function(
+    literal: str, replace: str
+) -> Optional[Callable[[str], str]]:
+    """Return a str based function for a rule matching '^' + literal, or None
+    if literal isn't one of the handled literal forms.
+    """
+    if not replace and literal.endswith(".*"):
+        prefix = literal[:-2]
+        if _REGEX_METACHARACTERS.intersection(prefix):
+            return None
+        return lambda line: "" if line.startswith(prefix) else line
+
+    if not replace and literal.endswith("$"):
+        line_text = literal[:-1]
+        if _REGEX_METACHARACTERS.intersection(line_text):
+            return None
+        return lambda line: "" if line == line_text else line
+
+    if "\\" in replace or _REGEX_METACHARACTERS.intersection(literal):
+        return None
+    length = len(literal)
+    return lambda line: replace + line[length:] if line.startswith(literal) else line
+
+
+@lru_cache(maxsize=32)
+def _compile_per_line_sub(
+    rules: tuple[PerLineSubRule, ...],
+) -> tuple[Optional[Pattern[str]], tuple[Callable[[str], str], ...]]:
+    """Compile the per-line sub rules once per distinct rule set.
+
+    Returns a prefilter and a function per rule, in order.
+    The prefilter combines every expression into one that matches a line
+    whenever at least one of the rules would; a line that no rule matches
+    is left untouched by every rule, so it can skip the per-rule
+    substitutions entirely. The prefilter is None when there is nothing to
+    combine or the expressions can't safely be combined, e.g. when one
+    refers to a group by number or sets inline flags, which before Python
+    3.11 apply to the whole combined pattern.
+    """
+    functions = tuple(_per_line_sub_function(rule) for rule in rules)
+    expressions = tuple(rule.search for rule in rules)
+    if not expressions or any(
+        "(?P=" in expression
+        or "(?(" in expression
+        or search(r"\\\d|\(\?[aiLmsux]", expression)
+        for expression in expressions
+    ):
+        return None, functions
+    try:
+        prefilter = re_compile(
+            "|".join(f"(?:{expression})" for expression in expressions)
+        )
+    except error:
+        return None, functions
+    return prefilter, functions
+
+
+def _load_from_string_lines(config: HConfig, config_text: str) -> None:  # noqa: C901, PLR0914
     config_text = config.driver.config_preprocessor(config_text)
+    per_line_sub_prefilter, per_line_subs = _compile_per_line_sub(
+        tuple(config.driver.rules.per_line_sub)
+    )
     current_section: Union[HConfig, HConfigChild] = config
     most_recent_item: Union[HConfig, HConfigChild] = current_section
     indent_adjust = 0
@@ -264,8 +350,9 @@ def _load_from_string_lines(config: HConfig, config_text: str) -> None:  # noqa:
 
         actual_indent = len(line) - len(line.lstrip())
         line = " " * actual_indent + " ".join(line.split())  # noqa: PLW2901
-        for rule in config.driver.rules.per_line_sub:
-            line = sub(rule.search, rule.replace, line)  # noqa: PLW2901
+        if per_line_sub_prefilter is None or per_line_sub_prefilter.search(line):
+            for per_line_sub in per_line_subs:
+                line = per_line_sub(line)  # noqa: PLW2901
         line = line.rstrip()  # noqa: PLW2901
 
         # If line is now empty, move to the next
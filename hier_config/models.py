@@ -1,4 +1,7 @@
 from enum import Enum, auto
+from functools import cached_property
+from re import Pattern
+from re import compile as re_compile
 from typing import Optional, Union
 
 from pydantic import BaseModel as PydanticBaseModel
@@ -26,6 +29,13 @@ class MatchRule(BaseModel):
     contains: Union[str, tuple[str, ...], None] = None
     re_search: Optional[str] = None
 
+    @cached_property
+    def re_search_pattern(self) -> Optional[Pattern[str]]:
+        """re_search compiled once per rule."""
+        if self.re_search is None:
+            return None
+        return re_compile(self.re_search)
+
 
 class TagRule(BaseModel):
     match_rules: tuple[MatchRule, ...]
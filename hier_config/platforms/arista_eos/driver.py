@@ -2,8 +2,10 @@ from hier_config.models import (
     IdempotentCommandsRule,
     MatchRule,
     NegationDefaultWhenRule,
-    PerLineSubRule,
-    SectionalExitingRule,
+)
+from hier_config.platforms.common_rules import (
+    BGP_SECTIONAL_EXITING,
+    COMMON_PER_LINE_SUB,
 )
 from hier_config.platforms.driver_base import HConfigDriverBase, HConfigDriverRules
 
@@ -12,46 +14,8 @@ class HConfigDriverAristaEOS(HConfigDriverBase):
     @staticmethod
     def _instantiate_rules() -> HConfigDriverRules:
         return HConfigDriverRules(
-            sectional_exiting=[
-                SectionalExitingRule(
-                    match_rules=(
-                        MatchRule(startswith="router bgp"),
-                        MatchRule(startswith="template peer-policy"),
-                    ),
-                    exit_text="exit-peer-policy",
-                ),
-                SectionalExitingRule(
-                    match_rules=(
-                        MatchRule(startswith="router bgp"),
-                        MatchRule(startswith="template peer-session"),
-                    ),
-                    exit_text="exit-peer-session",
-                ),
-                SectionalExitingRule(
-                    match_rules=(
-                        MatchRule(startswith="router bgp"),
-                        MatchRule(startswith="address-family"),
-                    ),
-                    exit_text="exit-address-family",
-                ),
-            ],
-            per_line_sub=[
-                PerLineSubRule(search="^Building configuration.*", replace=""),
-                PerLineSubRule(search="^Current configuration.*", replace=""),
-                PerLineSubRule(search="^! Last configuration change.*", replace=""),
-                PerLineSubRule(search="^! NVRAM config last updated.*", replace=""),
-                PerLineSubRule(search="^ntp clock-period .*", replace=""),
-                PerLineSubRule(search="^version.*", replace=""),
-                PerLineSubRule(search="^ logging event link-status$", replace=""),
-                PerLineSubRule(search="^ logging event subif-link-status$", replace=""),
-                PerLineSubRule(search="^\\s*ipv6 unreachables disable$", replace=""),
-                PerLineSubRule(search="^end$", replace=""),
-                PerLineSubRule(search="^\\s*[#!].*", replace=""),
-                PerLineSubRule(search="^ no ip address", replace=""),
-                PerLineSubRule(search="^ exit-peer-policy", replace=""),
-                PerLineSubRule(search="^ exit-peer-session", replace=""),
-                PerLineSubRule(search="^ exit-address-family", replace=""),
-            ],
+            sectional_exiting=list(BGP_SECTIONAL_EXITING),
+            per_line_sub=list(COMMON_PER_LINE_SUB),
             idempotent_commands=[
                 IdempotentCommandsRule(
                     match_rules=(MatchRule(startswith="hostname"),),
@@ -142,7 +106,10 @@ class HConfigDriverAristaEOS(HConfigDriverBase):
                 IdempotentCommandsRule(
                     match_rules=(
                         MatchRule(startswith="router bgp"),
-                        MatchRule(re_search="neighbor \\S+ description"),
+                        MatchRule(
+                            contains=" description",
+                            re_search="neighbor \\S+ description",
+                        ),
                     ),
                 ),
                 IdempotentCommandsRule(
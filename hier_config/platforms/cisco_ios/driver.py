@@ -1,3 +1,4 @@
+from itertools import count
 from logging import getLogger
 
 from hier_config.models import (
@@ -6,40 +7,51 @@ from hier_config.models import (
     NegationDefaultWithRule,
     OrderingRule,
     PerLineSubRule,
-    SectionalExitingRule,
+)
+from hier_config.platforms.common_rules import (
+    BGP_SECTIONAL_EXITING,
+    COMMON_PER_LINE_SUB,
 )
 from hier_config.platforms.driver_base import HConfigDriverBase, HConfigDriverRules
 from hier_config.root import HConfig
 
 logger = getLogger(__name__)
 
-
-def _rm_ipv6_acl_sequence_numbers(config: HConfig) -> None:
-    """If there are sequence numbers in the IPv6 ACL, remove them."""
-    for acl in config.get_children(startswith="ipv6 access-list "):
-        for entry in acl.children:
-            if entry.text.startswith("sequence"):
-                entry.text = " ".join(entry.text.split()[2:])
+_IPV4_ACL_ENTRY_PREFIXES = ("permit", "deny")
 
 
-def _remove_ipv4_acl_remarks(config: HConfig) -> None:
-    for acl in config.get_children(startswith="ip access-list "):
-        for entry in tuple(acl.children):
-            if entry.text.startswith("remark"):
-                entry.delete()
+def _process_acls(config: HConfig) -> None:
+    """Normalize ACLs in a single pass over the top level children.
 
-
-def _add_acl_sequence_numbers(config: HConfig) -> None:
-    """Add ACL sequence numbers."""
-    ipv4_acl_sw = "ip access-list"
-    acl_line_sw: tuple[str, ...] = ("permit", "deny")
+    - Remove sequence numbers from IPv6 ACL entries.
+    - Remove remarks from IPv4 ACLs.
+    - Add sequence numbers to IPv4 ACL permit and deny entries.
+    """
     for child in config.children:
-        if child.text.startswith(ipv4_acl_sw):
-            sequence_number = 10
-            for sub_child in child.children:
-                if sub_child.text.startswith(acl_line_sw):
-                    sub_child.text = f"{sequence_number} {sub_child.text}"
-                    sequence_number += 10
+        if child.text.startswith("ipv6 access-list "):
+            entries = list(child.children)
+            child.children.clear()
+            for entry in entries:
+                if entry.text.startswith("sequence"):
+                    # Drop "sequence <number> ", entry texts are single spaced
+                    entry.text = entry.text.partition(" ")[2].partition(" ")[2]
+            child.children.extend(entries)
+        elif child.text.startswith("ip access-list"):
+            remove_remarks = child.text.startswith("ip access-list ")
+            # Rebuild the entries in one pass rather than deleting remarks one
+            # at a time. Renaming entries while they are detached also avoids
+            # rebuilding the children mapping on every rename.
+            entries = [
+                entry
+                for entry in child.children
+                if not (remove_remarks and entry.text.startswith("remark"))
+            ]
+            child.children.clear()
+            sequence_numbers = count(10, 10)
+            for entry in entries:
+                if entry.text.startswith(_IPV4_ACL_ENTRY_PREFIXES):
+                    entry.text = f"{next(sequence_numbers)} {entry.text}"
+            child.children.extend(entries)
 
 
 class HConfigDriverCiscoIOS(HConfigDriverBase):
@@ -52,29 +64,7 @@ class HConfigDriverCiscoIOS(HConfigDriverBase):
                     use="logging console debugging",
                 ),
             ],
-            sectional_exiting=[
-                SectionalExitingRule(
-                    match_rules=(
-                        MatchRule(startswith="router bgp"),
-                        MatchRule(startswith="template peer-policy"),
-                    ),
-                    exit_text="exit-peer-policy",
-                ),
-                SectionalExitingRule(
-                    match_rules=(
-                        MatchRule(startswith="router bgp"),
-                        MatchRule(startswith="template peer-session"),
-                    ),
-                    exit_text="exit-peer-session",
-                ),
-                SectionalExitingRule(
-                    match_rules=(
-                        MatchRule(startswith="router bgp"),
-                        MatchRule(startswith="address-family"),
-                    ),
-                    exit_text="exit-address-family",
-                ),
-            ],
+            sectional_exiting=list(BGP_SECTIONAL_EXITING),
             ordering=[
                 OrderingRule(
                     match_rules=(
@@ -107,21 +97,7 @@ class HConfigDriverCiscoIOS(HConfigDriverBase):
                 ),
             ],
             per_line_sub=[
-                PerLineSubRule(search="^Building configuration.*", replace=""),
-                PerLineSubRule(search="^Current configuration.*", replace=""),
-                PerLineSubRule(search="^! Last configuration change.*", replace=""),
-                PerLineSubRule(search="^! NVRAM config last updated.*", replace=""),
-                PerLineSubRule(search="^ntp clock-period .*", replace=""),
-                PerLineSubRule(search="^version.*", replace=""),
-                PerLineSubRule(search="^ logging event link-status$", replace=""),
-                PerLineSubRule(search="^ logging event subif-link-status$", replace=""),
-                PerLineSubRule(search="^\\s*ipv6 unreachables disable$", replace=""),
-                PerLineSubRule(search="^end$", replace=""),
-                PerLineSubRule(search="^\\s*[#!].*", replace=""),
-                PerLineSubRule(search="^ no ip address", replace=""),
-                PerLineSubRule(search="^ exit-peer-policy", replace=""),
-                PerLineSubRule(search="^ exit-peer-session", replace=""),
-                PerLineSubRule(search="^ exit-address-family", replace=""),
+                *COMMON_PER_LINE_SUB,
                 PerLineSubRule(
                     search="^crypto key generate rsa general-keys.*$", replace=""
                 ),
@@ -171,12 +147,10 @@ class HConfigDriverCiscoIOS(HConfigDriverBase):
                     ),
                 ),
                 IdempotentCommandsRule(
-                    match_rules=(MatchRule(re_search=r"^(no )?logging console.*"),),
+                    match_rules=(
+                        MatchRule(startswith=("logging console", "no logging console")),
+                    ),
                 ),
             ],
-            post_load_callbacks=[
-                _rm_ipv6_acl_sequence_numbers,
-                _remove_ipv4_acl_remarks,
-                _add_acl_sequence_numbers,
-            ],
+            post_load_callbacks=[_process_acls],
         )
@@ -1,6 +1,7 @@
 from collections.abc import Iterable
+from functools import lru_cache
 from ipaddress import AddressValueError, IPv4Address, IPv4Interface
-from re import sub
+from string import ascii_letters
 from typing import Optional
 
 from hier_config.child import HConfigChild
@@ -17,12 +18,25 @@ from hier_config.platforms.view_base import (
     HConfigViewBase,
 )
 
+# Either line enables NAC on an interface
+_NAC_LINES = ("authentication port-control auto", "mab")
+_NAC_HOST_MODES = {host_mode.value: host_mode for host_mode in NACHostMode}
+_VLAN_RANGE_CHARACTERS = frozenset("0123456789,-")
+# The characters of an interface type e.g. 'GigabitEthernet' or 'Port-channel'
+_INTERFACE_TYPE_CHARACTERS = f"{ascii_letters}-"
+
+
+# Interface addresses repeat across views of the same device's configs
+@lru_cache(maxsize=4096)
+def _ipv4_interface(address: str) -> IPv4Interface:
+    return IPv4Interface(address)
+
 
 class ConfigViewInterfaceCiscoIOS(ConfigViewInterfaceBase):  # noqa: PLR0904
     @property
     def bundle_id(self) -> Optional[str]:
         if channel_group := self.config.get_child(startswith="channel-group"):
-            return channel_group.text.split()[1]
+            return channel_group.text.split(maxsplit=2)[1]
         return None
 
     @property
@@ -44,7 +58,7 @@ class ConfigViewInterfaceCiscoIOS(ConfigViewInterfaceBase):  # noqa: PLR0904
     @property
     def duplex(self) -> InterfaceDuplex:
         if duplex := self.config.get_child(startswith="duplex "):
-            return InterfaceDuplex(duplex.text.split()[1])
+            return InterfaceDuplex(duplex.text.split(maxsplit=2)[1])
         return InterfaceDuplex.AUTO
 
     @property
@@ -53,13 +67,8 @@ class ConfigViewInterfaceCiscoIOS(ConfigViewInterfaceBase):  # noqa: PLR0904
 
     @property
     def has_nac(self) -> bool:
-        return any(
-            line in self.config.children
-            for line in (
-                "authentication port-control auto",
-                "mab",
-            )
-        )
+        children = self.config.children
+        return any(line in children for line in _NAC_LINES)
 
     @property
     def ipv4_interface(self) -> Optional[IPv4Interface]:
@@ -68,9 +77,9 @@ class ConfigViewInterfaceCiscoIOS(ConfigViewInterfaceBase):  # noqa: PLR0904
     @property
     def ipv4_interfaces(self) -> Iterable[IPv4Interface]:
         for ipv4_address_obj in self.config.get_children(startswith="ip address "):
-            ipv4_address = ipv4_address_obj.text.split()
+            ipv4_address = ipv4_address_obj.text.split(maxsplit=4)
             try:
-                yield IPv4Interface("/".join(ipv4_address[2:4]))
+                yield _ipv4_interface("/".join(ipv4_address[2:4]))
             except AddressValueError:
                 continue
 
@@ -109,15 +118,9 @@ class ConfigViewInterfaceCiscoIOS(ConfigViewInterfaceBase):  # noqa: PLR0904
         if mode is None:
             return None
 
-        mode_word = mode.text.split()[2]
-        if mode_word == "multi-auth":
-            return NACHostMode.MULTI_AUTH
-        if mode_word == "multi-domain":
-            return NACHostMode.MULTI_DOMAIN
-        if mode_word == "multi-host":
-            return NACHostMode.MULTI_HOST
-        if mode_word == "single-host":
-            return NACHostMode.SINGLE_HOST
+        mode_word = mode.text.split(maxsplit=3)[2]
+        if host_mode := _NAC_HOST_MODES.get(mode_word):
+            return host_mode
 
         message = f"Unhandled NAC host mode: {mode_word}"
         raise ValueError(message)
@@ -139,49 +142,59 @@ class ConfigViewInterfaceCiscoIOS(ConfigViewInterfaceBase):  # noqa: PLR0904
 
     @property
     def name(self) -> str:
-        return self.config.text.split()[1]
+        return self.config.text.split(maxsplit=2)[1]
+
+    @property
+    def native_vlan(self) -> Optional[int]:  # noqa: C901
+        # Collect the relevant lines in a single pass over the children,
+        # keeping the first of each
+        encapsulation = trunk_native_vlan = access_vlan = None
+        is_routed = is_trunk = False
+        for child in self.config.children:
+            text = child.text
+            if text == "no switchport" or text.startswith("ip address "):
+                is_routed = True
+            elif text == "switchport mode trunk":
+                is_trunk = True
+            elif encapsulation is None and text.startswith("encapsulation dot1Q "):
+                encapsulation = text
+            elif trunk_native_vlan is None and text.startswith(
+                "switchport trunk native vlan "
+            ):
+                trunk_native_vlan = text
+            elif access_vlan is None and text.startswith("switchport access vlan "):
+                access_vlan = text
 
-    @property
-    def native_vlan(self) -> Optional[int]:
         # It's configured as a sub-interface
-        if self.is_subinterface and (
-            vlan := self.config.get_child(startswith="encapsulation dot1Q ")
-        ):
-            return int(vlan.text.split()[2])
+        if encapsulation is not None and self.is_subinterface:
+            return int(encapsulation.split(maxsplit=3)[2])
 
         # It's not a switchport
-        if (
-            self.config.get_child(equals="no switchport")
-            or self.config.get_child(startswith="ip address ")
-            or self.is_loopback
-            or self.is_svi
-        ):
+        if is_routed or self.is_loopback or self.is_svi:
             return None
 
         # It's configured as a trunk
-        if self.config.get_child(equals="switchport mode trunk"):
-            if vlan := self.config.get_child(
-                startswith="switchport trunk native vlan ",
-            ):
-                return int(vlan.text.split()[4])
+        if is_trunk:
+            if trunk_native_vlan is not None:
+                return int(trunk_native_vlan.split(maxsplit=5)[4])
 
             return None
 
         # It's either dynamic or configured as an access port
-        if vlan := self.config.get_child(startswith="switchport access vlan "):
-            return int(vlan.text.split()[3])
+        if access_vlan is not None:
+            return int(access_vlan.split(maxsplit=4)[3])
 
         # Default VLAN
         return 1
 
     @property
     def number(self) -> str:
-        return sub(r"^[a-zA-Z-]+", "", self.name)
+        return self.name.lstrip(_INTERFACE_TYPE_CHARACTERS)
 
     @property
     def parent_name(self) -> Optional[str]:
         if self.is_subinterface:
-            return self.name.split(".")[0]
+            return self.name.partition(".")[0]
         return None
 
     @property
@@ -190,19 +203,19 @@ class ConfigViewInterfaceCiscoIOS(ConfigViewInterfaceBase):  # noqa: PLR0904
 
     @property
     def port_number(self) -> int:
-        return int(self.name.split("/")[-1].split(".")[0])
+        return int(self.name.rpartition("/")[2].partition(".")[0])
 
     @property
     def speed(self) -> Optional[tuple[int, ...]]:
         if speed := self.config.get_child(startswith="speed "):
             if speed.text == "auto":
                 return None
-            return (int(speed.text.split()[1]),)
+            return (int(speed.text.split(maxsplit=2)[1]),)
         return None
 
     @property
     def subinterface_number(self) -> Optional[int]:
-        return int(self.name.split(".")[0 - 1]) if self.is_subinterface else None
+        return int(self.name.rpartition(".")[2]) if self.is_subinterface else None
 
     @property
     def tagged_all(self) -> bool:
@@ -216,13 +229,13 @@ class ConfigViewInterfaceCiscoIOS(ConfigViewInterfaceBase):  # noqa: PLR0904
         if child := self.config.get_child(
             re_search="^switchport trunk allowed vlan [0-9,-]+$",
         ):
-            return expand_range(child.text.split()[4])
+            return expand_range(child.text.split(maxsplit=5)[4])
         return ()
 
     @property
     def vrf(self) -> str:
         if vrf := self.config.get_child(startswith="ip vrf forwarding "):
-            return vrf.text.split()[3]
+            return vrf.text.split(maxsplit=4)[3]
         return ""
 
     @property
@@ -243,7 +256,7 @@ class HConfigViewCiscoIOS(HConfigViewBase):
     @property
     def hostname(self) -> Optional[str]:
         if child := self.config.get_child(startswith="hostname "):
-            return child.text.split()[1].lower()
+            return child.text.split(maxsplit=2)[1].lower()
         return None
 
     @property
@@ -263,7 +276,7 @@ class HConfigViewCiscoIOS(HConfigViewBase):
     @property
     def ipv4_default_gw(self) -> Optional[IPv4Address]:
         if gateway := self.config.get_child(startswith="ip default-gateway "):
-            return IPv4Address(gateway.text.split()[2])
+            return IPv4Address(gateway.text.split(maxsplit=3)[2])
         return None
 
     @property
@@ -281,8 +294,11 @@ class HConfigViewCiscoIOS(HConfigViewBase):
         member 2 priority 254
         ...
         """
-        for member in self.config.get_children(re_search="^switch .* provision .*"):
-            words = member.text.split()
+        for member in self.config.get_children(startswith="switch "):
+            # Equivalent to re_search="^switch .* provision .*"
+            if " provision " not in member.text.partition(" ")[2]:
+                continue
+            words = member.text.split(maxsplit=4)
             member_id = int(words[1])
             yield StackMember(
                 id=member_id,
@@ -296,12 +312,16 @@ class HConfigViewCiscoIOS(HConfigViewBase):
         yielded_vlans: set[int] = set()
 
         # Yield explicitly defined VLANs
-        for child in self.config.get_children(re_search="^vlan [0-9,-]+$"):
+        for child in self.config.get_children(startswith="vlan "):
+            # Equivalent to re_search="^vlan [0-9,-]+$"
+            vlan_range = child.text[5:]
+            if not vlan_range or not _VLAN_RANGE_CHARACTERS.issuperset(vlan_range):
+                continue
             vlan_name = None
             if name := child.get_child(startswith="name "):
                 _, vlan_name = name.text.split(maxsplit=1)
                 vlan_name = vlan_name.replace('"', "")
-            for vlan_id in expand_range(child.text.split()[1]):
+            for vlan_id in expand_range(vlan_range):
                 yielded_vlans.add(vlan_id)
                 yield Vlan(
                     id=vlan_id,
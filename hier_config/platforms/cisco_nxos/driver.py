@@ -29,7 +29,9 @@ class HConfigDriverCiscoNXOS(HConfigDriverBase):
                 IdempotentCommandsAvoidRule(
                     match_rules=(
                         MatchRule(startswith="interface"),
-                        MatchRule(re_search="ip address.*secondary"),
+                        MatchRule(
+                            contains="secondary", re_search="ip address.*secondary"
+                        ),
                     ),
                 ),
             ],
@@ -154,21 +156,21 @@ class HConfigDriverCiscoNXOS(HConfigDriverBase):
                 IdempotentCommandsRule(
                     match_rules=(
                         MatchRule(startswith="interface"),
-                        MatchRule(re_search="^hsrp \\d+"),
+                        MatchRule(startswith="hsrp ", re_search="^hsrp \\d+"),
                         MatchRule(startswith="ip"),
                     ),
                 ),
                 IdempotentCommandsRule(
                     match_rules=(
                         MatchRule(startswith="interface"),
-                        MatchRule(re_search="^hsrp \\d+"),
+                        MatchRule(startswith="hsrp ", re_search="^hsrp \\d+"),
                         MatchRule(startswith="priority"),
                     ),
                 ),
                 IdempotentCommandsRule(
                     match_rules=(
                         MatchRule(startswith="interface"),
-                        MatchRule(re_search="^hsrp \\d+"),
+                        MatchRule(startswith="hsrp ", re_search="^hsrp \\d+"),
                         MatchRule(startswith="authentication md5 key-string"),
                     ),
                 ),
@@ -280,6 +282,7 @@ class HConfigDriverCiscoNXOS(HConfigDriverBase):
                     match_rules=(
                         MatchRule(startswith="router bgp"),
                         MatchRule(
+                            contains=" description",
                             re_search="neighbor \\S+ description",
                         ),
                     ),
@@ -290,12 +293,6 @@ class HConfigDriverCiscoNXOS(HConfigDriverBase):
                         MatchRule(startswith="router-id"),
                     ),
                 ),
-                IdempotentCommandsRule(
-                    match_rules=(
-                        MatchRule(startswith="router ospf"),
-                        MatchRule(startswith="log-adjacency-changes"),
-                    ),
-                ),
                 IdempotentCommandsRule(
                     match_rules=(
                         MatchRule(startswith="ipv6 router ospf"),
@@ -0,0 +1,46 @@
+from hier_config.models import MatchRule, PerLineSubRule, SectionalExitingRule
+
+# Rules shared verbatim by the Cisco IOS like drivers (Arista EOS and Cisco IOS).
+# The rule models are frozen, so the same instances can be shared between drivers.
+
+BGP_SECTIONAL_EXITING: tuple[SectionalExitingRule, ...] = (
+    SectionalExitingRule(
+        match_rules=(
+            MatchRule(startswith="router bgp"),
+            MatchRule(startswith="template peer-policy"),
+        ),
+        exit_text="exit-peer-policy",
+    ),
+    SectionalExitingRule(
+        match_rules=(
+            MatchRule(startswith="router bgp"),
+            MatchRule(startswith="template peer-session"),
+        ),
+        exit_text="exit-peer-session",
+    ),
+    SectionalExitingRule(
+        match_rules=(
+            MatchRule(startswith="router bgp"),
+            MatchRule(startswith="address-family"),
+        ),
+        exit_text="exit-address-family",
+    ),
+)
+
+COMMON_PER_LINE_SUB: tuple[PerLineSubRule, ...] = (
+    PerLineSubRule(search="^Building configuration.*", replace=""),
+    PerLineSubRule(search="^Current configuration.*", replace=""),
+    PerLineSubRule(search="^! Last configuration change.*", replace=""),
+    PerLineSubRule(search="^! NVRAM config last updated.*", replace=""),
+    PerLineSubRule(search="^ntp clock-period .*", replace=""),
+    PerLineSubRule(search="^version.*", replace=""),
+    PerLineSubRule(search="^ logging event link-status$", replace=""),
+    PerLineSubRule(search="^ logging event subif-link-status$", replace=""),
+    PerLineSubRule(search="^\\s*ipv6 unreachables disable$", replace=""),
+    PerLineSubRule(search="^end$", replace=""),
+    PerLineSubRule(search="^\\s*[#!].*", replace=""),
+    PerLineSubRule(search="^ no ip address", replace=""),
+    PerLineSubRule(search="^ exit-peer-policy", replace=""),
+    PerLineSubRule(search="^ exit-peer-session", replace=""),
+    PerLineSubRule(search="^ exit-address-family", replace=""),
+)
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Iterable
-from typing import Optional
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import Any, ClassVar, Generic, Optional, Protocol, TypeVar, cast
 
 from pydantic import Field, PositiveInt
 
@@ -11,6 +11,7 @@ from hier_config.models import (
     IdempotentCommandsAvoidRule,
     IdempotentCommandsRule,
     IndentAdjustRule,
+    MatchRule,
     NegationDefaultWhenRule,
     NegationDefaultWithRule,
     OrderingRule,
@@ -46,31 +47,145 @@ class HConfigDriverRules(BaseModel):  # pylint: disable=too-many-instance-attrib
     )
 
 
+class _LineageRule(Protocol):  # pylint: disable=too-few-public-methods
+    @property
+    def match_rules(self) -> tuple[MatchRule, ...]: ...
+
+
+_LineageRuleT = TypeVar("_LineageRuleT", bound=_LineageRule)
+
+
+class _RulePrefixIndex(Generic[_LineageRuleT]):
+    """Rules grouped by lineage depth and by the equals texts or startswith
+    prefixes of their last match rule, so a child is only tested against
+    the rules that could match it.
+    """
+
+    def __init__(self, rules: tuple[_LineageRuleT, ...]) -> None:
+        self.rules = rules
+        unindexed: dict[int, list[int]] = {}
+        equals: dict[int, dict[str, list[int]]] = {}
+        prefixes: dict[int, dict[str, list[int]]] = {}
+        for position, rule in enumerate(rules):
+            depth = len(rule.match_rules)
+            last_rule = rule.match_rules[-1] if depth else None
+            if last_rule is not None and last_rule.equals is not None:
+                texts = last_rule.equals
+                for text in (texts,) if isinstance(texts, str) else texts:
+                    equals.setdefault(depth, {}).setdefault(text, []).append(position)
+            elif last_rule is not None and last_rule.startswith is not None:
+                startswith = last_rule.startswith
+                for prefix in (
+                    (startswith,) if isinstance(startswith, str) else startswith
+                ):
+                    prefixes.setdefault(depth, {}).setdefault(prefix, []).append(
+                        position
+                    )
+            else:
+                unindexed.setdefault(depth, []).append(position)
+
+        self._depths: dict[
+            int,
+            tuple[
+                tuple[int, ...],
+                dict[str, list[int]],
+                dict[str, list[int]],
+                tuple[int, ...],
+            ],
+        ] = {
+            depth: (
+                tuple(unindexed.get(depth, ())),
+                equals.get(depth, {}),
+                prefixes.get(depth, {}),
+                tuple(sorted({len(prefix) for prefix in prefixes.get(depth, {})})),
+            )
+            for depth in unindexed.keys() | equals.keys() | prefixes.keys()
+        }
+
+    def candidates(self, config: HConfigChild) -> list[_LineageRuleT]:
+        """The rules, in order, that config could match."""
+        if (depth := self._depths.get(config.depth())) is None:
+            return []
+
+        unindexed, equals, prefixes, lengths = depth
+        text = config.text
+        positions = set(unindexed)
+        positions.update(equals.get(text, ()))
+        for length in lengths:
+            if length > len(text):
+                break
+            positions.update(prefixes.get(text[:length], ()))
+
+        return [self.rules[position] for position in sorted(positions)]
+
+    def is_current(self, rules: Sequence[_LineageRuleT]) -> bool:
+        """Check that rules still hold exactly the indexed rules, in order.
+
+        Comparing by identity is still far cheaper than the lineage matches
+        the index saves.
+        """
+        return len(rules) == len(self.rules) and all(
+            rule is indexed_rule for rule, indexed_rule in zip(rules, self.rules)
+        )
+
+
 class HConfigDriverBase(ABC):
     """Defines all hier_config options, rules, and rule checking methods.
     Override methods as needed.
     """
 
+    # The rules built by _instantiate_rules(), once per driver class
+    _rules_by_class: ClassVar[dict[type["HConfigDriverBase"], HConfigDriverRules]] = {}
+
     def __init__(self) -> None:
-        self.rules = self._instantiate_rules()
+        rules = self._rules_by_class.get(type(self))
+        if rules is None:
+            rules = self._instantiate_rules()
+            self._rules_by_class[type(self)] = rules
+        # Copy the lists so that rules can be added to one driver instance
+        # without affecting the others. The rule models themselves are frozen.
+        update: dict[str, list[object]] = {
+            name: list(cast("list[object]", value))
+            for name, value in rules
+            if isinstance(value, list)
+        }
+        self.rules = rules.model_copy(update=update)
+        # Only the driver's own rule lists are indexed. They live as long as
+        # the driver, which bounds the cache and keeps their ids unique.
+        self._rule_list_ids = frozenset(id(value) for value in update.values())
+        self._prefix_indexes: dict[int, _RulePrefixIndex[Any]] = {}
+
+    def matching_rules(
+        self,
+        rules: Sequence[_LineageRuleT],
+        config: HConfigChild,
+    ) -> Iterator[_LineageRuleT]:
+        """Yield, in order, the rules whose match_rules match the lineage of config."""
+        if not rules:
+            return
+        for rule in self._candidates(rules, config):
+            if config.is_lineage_match(rule.match_rules):
+                yield rule
 
     def idempotent_for(
         self,
         config: HConfigChild,
         other_children: Iterable[HConfigChild],
     ) -> Optional[HConfigChild]:
-        for rule in self.rules.idempotent_commands:
-            if config.is_lineage_match(rule.match_rules):
-                for other_child in other_children:
-                    if other_child.is_lineage_match(rule.match_rules):
-                        return other_child
+        for rule in self.matching_rules(self.rules.idempotent_commands, config):
+            for other_child in other_children:
+                if other_child.is_lineage_match(rule.match_rules):
+                    return other_child
         return None
 
     def negate_with(self, config: HConfigChild) -> Optional[str]:
-        for with_rule in self.rules.negate_with:
-            if config.is_lineage_match(with_rule.match_rules):
-                return with_rule.use
-        return None
+        return next(
+            (
+                with_rule.use
+                for with_rule in self.matching_rules(self.rules.negate_with, config)
+            ),
+            None,
+        )
 
     def swap_negation(self, child: HConfigChild) -> HConfigChild:
         """Swap negation of a `child.text`."""
@@ -89,6 +204,26 @@ class HConfigDriverBase(ABC):
     def negation_prefix(self) -> str:
         return "no "
 
+    def _candidates(
+        self,
+        rules: Sequence[_LineageRuleT],
+        config: HConfigChild,
+    ) -> Sequence[_LineageRuleT]:
+        """The rules that config could match.
+
+        The driver's rule lists are narrowed down through an index that is
+        rebuilt whenever the list has changed. Any other sequence of rules
+        is returned as it is.
+        """
+        key = id(rules)
+        if key not in self._rule_list_ids:
+            return rules
+        index = self._prefix_indexes.get(key)
+        if index is None or not index.is_current(rules):
+            index = _RulePrefixIndex(tuple(rules))
+            self._prefix_indexes[key] = index
+        return index.candidates(config)
+
     @staticmethod
     def config_preprocessor(config_text: str) -> str:
         return config_text
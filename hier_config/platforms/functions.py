@@ -1,3 +1,8 @@
+from functools import lru_cache
+
+
+# The same ranges, e.g. trunk allowed VLANs, tend to repeat across interfaces
+@lru_cache(maxsize=1024)
 def expand_range(number_range_str: str) -> tuple[int, ...]:
     """Expand ranges like 2-5,8,22-45."""
     numbers: list[int] = []
@@ -6,7 +11,7 @@ def expand_range(number_range_str: str) -> tuple[int, ...]:
         if len(start_stop) == 2:
             start = int(start_stop[0])
             stop = int(start_stop[1])
-            numbers.extend(n for n in range(start, stop + 1))
+            numbers.extend(range(start, stop + 1))
         else:
             numbers.append(int(start_stop[0]))
     if len(set(numbers)) != len(numbers):
@@ -172,9 +172,8 @@ class HConfig(HConfigBase):  # noqa: PLR0904
     def set_order_weight(self) -> HConfig:
         """Sets self.order integer on all children."""
         for child in self.all_children():
-            for rule in self.driver.rules.ordering:
-                if child.is_lineage_match(rule.match_rules):
-                    child.order_weight = rule.weight
+            for rule in self.driver.matching_rules(self.driver.rules.ordering, child):
+                child.order_weight = rule.weight
         return self
 
     def future(self, config: HConfig) -> HConfig:
@@ -1,6 +1,12 @@
+from typing import Optional
+
+import pytest
+
 from hier_config import get_hconfig, get_hconfig_view
 from hier_config.models import Platform
+from hier_config.platforms.functions import expand_range
 from hier_config.platforms.hp_procurve.functions import hp_procurve_expand_range
+from hier_config.platforms.models import NACHostMode
 
 
 def test_hp_procurve_expand_range() -> None:
@@ -33,6 +39,13 @@ def test_hp_procurve_expand_range() -> None:
     )
 
 
+def test_expand_range() -> None:
+    assert expand_range("2-5,8,22-24") == (2, 3, 4, 5, 8, 22, 23, 24)
+    assert expand_range("10") == (10,)
+    with pytest.raises(ValueError, match="len"):
+        expand_range("1-3,2")
+
+
 def test_bundle_name() -> None:
     config = get_hconfig(Platform.CISCO_IOS)
     config.add_children_deep(("interface GigabitEthernet1/1/3", "channel-group 1"))
@@ -43,3 +56,116 @@ def test_bundle_name() -> None:
     )
     assert interface_view is not None
     assert interface_view.bundle_name == "Port-channel1"
+
+
+def test_interface_views_follow_the_config() -> None:
+    config = get_hconfig(Platform.CISCO_IOS)
+    config.add_children_deep(("vlan 10", "name users"))
+    config.add_children_deep(
+        ("interface GigabitEthernet1/0/1", "switchport access vlan 20")
+    )
+    config.add_child("interface Vlan10")
+    view = get_hconfig_view(config)
+
+    assert view.interface_names_mentioned == frozenset(
+        ("GigabitEthernet1/0/1", "Vlan10")
+    )
+    assert [vlan.id for vlan in view.vlans] == [10, 20]
+
+    # Interfaces added after the first access are seen
+    config.add_children_deep(
+        ("interface GigabitEthernet1/0/2", "switchport access vlan 30")
+    )
+    assert view.interface_names_mentioned == frozenset(
+        ("GigabitEthernet1/0/1", "GigabitEthernet1/0/2", "Vlan10")
+    )
+    assert [vlan.id for vlan in view.vlans] == [10, 20, 30]
+
+    # As are renamed interfaces
+    interface_view = view.interface_view_by_name("GigabitEthernet1/0/2")
+    assert interface_view is not None
+    interface_view.config.text = "interface GigabitEthernet1/0/3"
+    assert interface_view.name == "GigabitEthernet1/0/3"
+
+
+def test_cisco_ios_vlans_and_stack_members() -> None:
+    config = get_hconfig(
+        Platform.CISCO_IOS,
+        "switch 1 provision ws-c3850-48p\n"
+        "switch 2 priority 14\n"
+        "switch provision x\n"
+        "vlan 10,12-13\n"
+        " name users\n"
+        "vlan internal allocation policy ascending\n",
+    )
+    view = get_hconfig_view(config)
+
+    assert [(vlan.id, vlan.name) for vlan in view.vlans] == [
+        (10, "users"),
+        (12, "users"),
+        (13, "users"),
+    ]
+    assert [(member.id, member.model) for member in view.stack_members] == [
+        (1, "ws-c3850-48p")
+    ]
+
+
+def test_cisco_ios_nac_host_mode() -> None:
+    config = get_hconfig(Platform.CISCO_IOS)
+    config.add_children_deep(
+        ("interface GigabitEthernet1/0/1", "authentication host-mode multi-auth")
+    )
+    config.add_children_deep(
+        ("interface GigabitEthernet1/0/2", "authentication host-mode other")
+    )
+    config.add_child("interface GigabitEthernet1/0/3")
+    view = get_hconfig_view(config)
+
+    interface_view = view.interface_view_by_name("GigabitEthernet1/0/1")
+    assert interface_view is not None
+    assert interface_view.nac_host_mode is NACHostMode.MULTI_AUTH
+    interface_view = view.interface_view_by_name("GigabitEthernet1/0/3")
+    assert interface_view is not None
+    assert interface_view.nac_host_mode is None
+    interface_view = view.interface_view_by_name("GigabitEthernet1/0/2")
+    assert interface_view is not None
+    with pytest.raises(ValueError, match="Unhandled NAC host mode: other"):
+        _ = interface_view.nac_host_mode
+
+
+def test_cisco_ios_native_vlan() -> None:
+    cases: tuple[tuple[str, tuple[str, ...], Optional[int]], ...] = (
+        (
+            "GigabitEthernet0/0.20",
+            ("encapsulation dot1Q 20", "ip address 192.0.2.1 255.255.255.0"),
+            20,
+        ),
+        ("GigabitEthernet0/0.30", ("ip address 192.0.2.1 255.255.255.0",), None),
+        ("GigabitEthernet1/0/1", ("no switchport", "switchport access vlan 10"), None),
+        ("GigabitEthernet1/0/2", ("ip address 192.0.2.1 255.255.255.0",), None),
+        ("Loopback0", (), None),
+        ("Vlan10", ("switchport access vlan 10",), None),
+        (
+            "GigabitEthernet1/0/3",
+            ("switchport trunk native vlan 99", "switchport mode trunk"),
+            99,
+        ),
+        (
+            "GigabitEthernet1/0/4",
+            ("switchport mode trunk", "switchport access vlan 10"),
+            None,
+        ),
+        (
+            "GigabitEthernet1/0/5",
+            ("switchport access vlan 10", "switchport mode access"),
+            10,
+        ),
+        ("GigabitEthernet1/0/6", ("switchport mode access",), 1),
+    )
+    for name, lines, native_vlan in cases:
+        config = get_hconfig(Platform.CISCO_IOS)
+        config.add_children_deep((f"interface {name}",)).add_children(lines)
+        interface_view = get_hconfig_view(config).interface_view_by_name(name)
+
+        assert interface_view is not None
+        assert interface_view.native_vlan == native_vlan, name
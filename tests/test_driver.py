@@ -1,5 +1,5 @@
-from hier_config import get_hconfig_driver
-from hier_config.models import Platform
+from hier_config import get_hconfig, get_hconfig_driver
+from hier_config.models import MatchRule, OrderingRule, Platform
 from hier_config.platforms.arista_eos.driver import HConfigDriverAristaEOS
 from hier_config.platforms.cisco_ios.driver import HConfigDriverCiscoIOS
 from hier_config.platforms.cisco_nxos.driver import HConfigDriverCiscoNXOS
@@ -19,3 +19,101 @@ def test_get_hconfig_driver() -> None:
     assert isinstance(get_hconfig_driver(Platform.HP_PROCURVE), HConfigDriverHPProcurve)
     assert isinstance(get_hconfig_driver(Platform.HP_COMWARE5), HConfigDriverHPComware5)
     assert isinstance(get_hconfig_driver(Platform.VYOS), HConfigDriverVYOS)
+
+
+def test_matching_rules() -> None:
+    driver = get_hconfig_driver(Platform.GENERIC)
+    driver.rules.ordering.extend(
+        (
+            OrderingRule(match_rules=(MatchRule(startswith="ntp"),), weight=1),
+            OrderingRule(
+                match_rules=(MatchRule(startswith=("ip", "ntp server")),), weight=2
+            ),
+            OrderingRule(match_rules=(MatchRule(re_search="server"),), weight=3),
+        )
+    )
+    config = get_hconfig(driver, "ntp server 192.0.2.1\ninterface Vlan2\n  ip mtu 1500")
+    ntp_server = config.get_child(equals="ntp server 192.0.2.1")
+    ip_mtu = config.get_child_deep(
+        (MatchRule(equals="interface Vlan2"), MatchRule(equals="ip mtu 1500"))
+    )
+    assert ntp_server
+    assert ip_mtu
+
+    rules = driver.rules.ordering
+    assert [rule.weight for rule in driver.matching_rules(rules, ntp_server)] == [
+        1,
+        2,
+        3,
+    ]
+    assert not tuple(driver.matching_rules(rules, ip_mtu))
+
+    # Changes to the rules are picked up on the next lookup
+    rules.append(
+        OrderingRule(
+            match_rules=(MatchRule(startswith="interface"), MatchRule(startswith="ip")),
+            weight=4,
+        )
+    )
+    assert [rule.weight for rule in driver.matching_rules(rules, ip_mtu)] == [4]
+
+    rules.extend(
+        (
+            OrderingRule(
+                match_rules=(
+                    MatchRule(startswith="interface"),
+                    MatchRule(equals=frozenset(("ip mtu 1500", "ip mtu 9000"))),
+                ),
+                weight=5,
+            ),
+            OrderingRule(
+                match_rules=(
+                    MatchRule(startswith="interface"),
+                    MatchRule(equals="ip mtu"),
+                ),
+                weight=6,
+            ),
+        )
+    )
+    assert [rule.weight for rule in driver.matching_rules(rules, ip_mtu)] == [4, 5]
+
+    # As are rules inserted ahead of the others
+    rules.insert(0, OrderingRule(match_rules=(MatchRule(startswith="ntp"),), weight=7))
+    assert [rule.weight for rule in driver.matching_rules(rules, ntp_server)] == [
+        7,
+        1,
+        2,
+        3,
+    ]
+
+    # As are rules replaced in place
+    rules[2] = OrderingRule(
+        match_rules=(MatchRule(startswith="ntp server 192.0.2."),), weight=99
+    )
+    assert [rule.weight for rule in driver.matching_rules(rules, ntp_server)] == [
+        7,
+        1,
+        99,
+        3,
+    ]
+    config.set_order_weight()
+    assert ntp_server.order_weight == 3
+
+    # Rules that are not one of the driver's lists are matched as they are
+    assert [
+        rule.weight for rule in driver.matching_rules(tuple(rules[1:3]), ntp_server)
+    ] == [1, 99]
+
+
+def test_driver_rules_are_independent_per_instance() -> None:
+    driver_a = HConfigDriverCiscoIOS()
+    driver_b = HConfigDriverCiscoIOS()
+    ordering_count = len(driver_b.rules.ordering)
+
+    driver_a.rules.ordering.append(
+        OrderingRule(match_rules=(MatchRule(startswith="snmp-server"),), weight=50)
+    )
+
+    assert driver_a.rules.ordering is not driver_b.rules.ordering
+    assert len(driver_b.rules.ordering) == ordering_count
+    assert len(HConfigDriverCiscoIOS().rules.ordering) == ordering_count
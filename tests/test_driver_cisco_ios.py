@@ -46,3 +46,27 @@ def test_logging_console_emergencies_scenario_3() -> None:
     running_after_rollback = future_config.future(rollback)
 
     assert not tuple(running_config.unified_diff(running_after_rollback))
+
+
+def test_acl_post_load_processing() -> None:
+    config = get_hconfig(
+        Platform.CISCO_IOS,
+        "ip access-list extended TEST\n"
+        " remark allow web\n"
+        " permit tcp any any eq 443\n"
+        " remark deny the rest\n"
+        " deny ip any any\n"
+        "ipv6 access-list TEST6\n"
+        " sequence 20 permit ipv6 any any\n",
+    )
+
+    assert config.dump_simple() == (
+        "ip access-list extended TEST",
+        "  10 permit tcp any any eq 443",
+        "  20 deny ip any any",
+        "ipv6 access-list TEST6",
+        "  permit ipv6 any any",
+    )
+    acl = config.get_child(equals="ip access-list extended TEST")
+    assert acl
+    assert acl.get_child(equals="20 deny ip any any")
@@ -13,7 +13,7 @@ from hier_config import (
     get_hconfig_from_dump,
 )
 from hier_config.exceptions import DuplicateChildError
-from hier_config.models import Instance, MatchRule, Platform
+from hier_config.models import Instance, MatchRule, PerLineSubRule, Platform
 
 
 def test_bool(platform_a: Platform) -> None:
@@ -190,6 +190,17 @@ def test_get_children(platform_a: Platform) -> None:
         assert child.text.startswith("interface Vlan")
 
 
+def test_is_match_re_search(platform_a: Platform) -> None:
+    hier = get_hconfig(platform_a)
+    child = hier.add_child("interface Vlan2")
+    rule = MatchRule(re_search="^interface Vlan[0-9]+$")
+    assert rule.re_search_pattern
+    assert child.is_match(re_search=rule.re_search)
+    assert child.is_match(re_search=rule.re_search_pattern)
+    assert not child.is_match(re_search=MatchRule(re_search="Vlan3").re_search_pattern)
+    assert child.is_lineage_match((rule,))
+
+
 def test_move(platform_a: Platform, platform_b: Platform) -> None:
     hier1 = get_hconfig(platform_a)
     interface1 = hier1.add_child("interface Vlan2")
@@ -712,3 +723,75 @@ def test_config_to_get_to_parent_identity() -> None:
     assert remediation_config_interface
     assert id(remediation_config_interface.parent) == id(remediation_config_hier)
     assert id(remediation_config_interface.root) == id(remediation_config_hier)
+
+
+def test_per_line_sub_rules_apply_in_order() -> None:
+    driver = get_hconfig_driver(Platform.GENERIC)
+    driver.rules.per_line_sub.extend(
+        (
+            PerLineSubRule(search="^hostname old-", replace="hostname new-"),
+            PerLineSubRule(search="^hostname new-(\\w+)-\\1$", replace="hostname \\1"),
+            PerLineSubRule(search="^\\s*[#!].*", replace=""),
+        )
+    )
+    config = get_hconfig(
+        driver, "hostname old-lab-lab\n  ! comment\nhostname-alias old-lab"
+    )
+
+    assert config.get_child(equals="hostname lab")
+    assert config.get_child(equals="hostname-alias old-lab")
+    assert len(config.children) == 2
+
+
+def test_per_line_sub_rules_with_inline_flags() -> None:
+    driver = get_hconfig_driver(Platform.GENERIC)
+    driver.rules.per_line_sub.extend(
+        (
+            PerLineSubRule(search="^ no ip address", replace=""),
+            PerLineSubRule(search="(?x) ^ foo \\s bar", replace="baz"),
+        )
+    )
+    config = get_hconfig(driver, "interface Vlan2\n no ip address dhcp\nfoo bar")
+
+    assert config.get_child(equals="baz")
+    interface = config.get_child(equals="interface Vlan2")
+    assert interface
+    assert interface.get_child(equals="dhcp")
+
+
+def test_get_children_startswith_first_word() -> None:
+    hier = get_hconfig(Platform.CISCO_IOS)
+    # Enough children for the first word index to be used
+    hier.add_children(f"vlan {vlan}" for vlan in range(2, 20))
+    hier.add_children(
+        ("ip route 0.0.0.0 0.0.0.0 192.0.2.1", "ipv6 route ::/0 2001:db8::1", "ip")
+    )
+    assert [child.text for child in hier.get_children(startswith="ip ")] == [
+        "ip route 0.0.0.0 0.0.0.0 192.0.2.1"
+    ]
+
+    hier.add_child("ip routing")
+    route = hier.get_child(startswith="ip route 0.0.0.0 ")
+    assert route
+    route.text = "ip domain-name example.com"
+    assert [child.text for child in hier.get_children(startswith="ip rout")] == [
+        "ip routing"
+    ]
+    assert [child.text for child in hier.get_children(startswith="ip")] == [
+        "ip domain-name example.com",
+        "ipv6 route ::/0 2001:db8::1",
+        "ip",
+        "ip routing",
+    ]
+    assert [
+        child.text for child in hier.get_children(startswith=("ipv6 ", "ip r", "ip"))
+    ] == [
+        "ip domain-name example.com",
+        "ipv6 route ::/0 2001:db8::1",
+        "ip",
+        "ip routing",
+    ]
+    assert [
+        child.text for child in hier.get_children(startswith=("ipv6 ", "ip r"))
+    ] == ["ipv6 route ::/0 2001:db8::1", "ip routing"]
+    assert not list(hier.get_children(startswith=()))